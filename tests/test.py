@@ -11,10 +11,11 @@ from src.config import Config
 
 
 class TestDataProcessing(unittest.TestCase):
-    def setUp(self):
-        """Load sample data before each test"""
-        self.df = load_all_regions_data()
-        self.cleaned_df = clean_data(self.df)
+    @classmethod
+    def setUpClass(cls):
+        """Load sample data once for all tests"""
+        cls.df = load_all_regions_data()
+        cls.cleaned_df = clean_data(cls.df)
 
     def test_data_loading(self):
         """Test if data is loaded correctly"""
@@ -23,8 +24,8 @@ class TestDataProcessing(unittest.TestCase):
     
     def test_data_cleaning(self):
         """Test if cleaning removes invalid values"""
-        self.assertFalse(self.cleaned_df.isna().sum().sum(), "Cleaned dataset should have no missing values")
-        self.assertTrue((self.cleaned_df[Config.SOLAR_COLS] >= 0).all().all(), "Solar columns should have non-negative values")
+        self.assertFalse(self.cleaned_df.isna().to_numpy().any(), "Cleaned dataset should have no missing values")
+        self.assertTrue((self.cleaned_df[Config.SOLAR_COLS].to_numpy() >= 0).all(), "Solar columns should have non-negative values")
     
 
 